@@ -2,7 +2,9 @@ import os
 import sys
 import glob
 from pathlib import Path
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
 import re
@@ -78,6 +80,7 @@ S3_BASE_PATH=raw
 
 # Configurações opcionais
 MAX_WORKERS=4
+PARQUET_PROFILE=balanced
 """
     
     env_file = '.env'
@@ -295,76 +298,379 @@ def parse_datasus_filename(filename):
     return info
 
 
-def create_realistic_sample_data(info, filename):
+# Tamanho dos lotes Arrow gerados na conversão
+CONVERSION_BATCH_SIZE = 65536
+
+# Colunas numéricas convertidas quando chegam como texto
+INTEGER_COLUMNS = ['IDADE', 'ANO', 'MES', 'PESO', 'APGAR1', 'APGAR5', 'QTDFILVIVO', 'QTDFILMORT', 'DIAS_PERM']
+FLOAT_COLUMNS = ['VAL_TOT', 'VALOR']
+
+# Números em texto; até 18 dígitos um inteiro sempre cabe em int64
+NUMERIC_PATTERN = r'^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$'
+INT64_PATTERN = r'^[-+]?\d{1,18}$'
+
+SIH_SAMPLE_SCHEMA = pa.schema([
+    ('UF_ZI', pa.string()),
+    ('ANO_CMPT', pa.string()),
+    ('MES_CMPT', pa.string()),
+    ('MUNIC_RES', pa.string()),
+    ('NASC', pa.string()),
+    ('SEXO', pa.string()),
+    ('IDADE', pa.int64()),
+    ('PROC_REA', pa.string()),
+    ('VAL_TOT', pa.float64()),
+    ('DIAS_PERM', pa.int64()),
+    ('DT_INTER', pa.string()),
+    ('DT_SAIDA', pa.string()),
+    ('DIAG_PRINC', pa.string()),
+    ('MORTE', pa.string()),
+    ('NACIONAL', pa.string()),
+    ('CEP', pa.string()),
+    ('ESPEC', pa.string()),
+    ('N_AIH', pa.string()),
+    ('IDENT', pa.string()),
+    ('COBRANCA', pa.string()),
+    ('NATUREZA', pa.string()),
+    ('GESTAO', pa.string()),
+    ('MUNIC_MOV', pa.string()),
+    ('COD_IDADE', pa.string()),
+    ('CAR_INT', pa.string()),
+    ('HOMONIMO', pa.string()),
+    ('NUM_FILHOS', pa.string()),
+    ('INSTRU', pa.string()),
+    ('VINCPREV', pa.string()),
+    ('SEQUENCIA', pa.int64()),
+    ('ARQUIVO_ORIGEM', pa.string()),
+])
+
+GENERIC_SAMPLE_SCHEMA = pa.schema([
+    ('REGISTRO', pa.int64()),
+    ('UF', pa.string()),
+    ('ANO', pa.int64()),
+    ('MES', pa.int64()),
+    ('CODIGO', pa.string()),
+    ('VALOR', pa.float64()),
+    ('ARQUIVO_ORIGEM', pa.string()),
+])
+
+
+def create_realistic_sample_batches(info, filename, batch_size=CONVERSION_BATCH_SIZE):
     """
-    Cria dados de amostra realistas baseados no sistema DATASUS
+    Gera lotes Arrow (RecordBatch) com dados de amostra do sistema DATASUS
     """
     
     if info['system'] == 'SIH':
         # Dados de exemplo para SIH
-        records = []
-        
-        for i in range(1000):
-            record = {
-                'UF_ZI': info['state'] or '35',
-                'ANO_CMPT': str(info['year'] or 2020),
-                'MES_CMPT': f"{info['month'] or (i % 12 + 1):02d}",
-                'MUNIC_RES': f"{info['state'] or '35'}{i % 100 + 1:04d}",
-                'NASC': f"{1950 + (i % 70)}{(i % 12 + 1):02d}{(i % 28 + 1):02d}",
-                'SEXO': '1' if i % 2 == 0 else '2',
-                'IDADE': 20 + (i % 60),
-                'PROC_REA': f"0301{i % 100:06d}",
-                'VAL_TOT': round(100 + (i * 15.75), 2),
-                'DIAS_PERM': 1 + (i % 30),
-                'DT_INTER': f"{info['year'] or 2020}{info['month'] or 1:02d}{(i % 28 + 1):02d}",
-                'DT_SAIDA': f"{info['year'] or 2020}{info['month'] or 1:02d}{(i % 28 + 1):02d}",
-                'DIAG_PRINC': f"I{10 + (i % 89)}{(i % 10)}",
-                'MORTE': '1' if i % 50 == 0 else '0',
-                'NACIONAL': '010',
-                'CEP': f"{i % 99999:05d}000",
-                'ESPEC': f"{i % 50 + 1:02d}",
-                'N_AIH': f"{2020000000 + i:010d}",
-                'IDENT': '1',
-                'COBRANCA': '1',
-                'NATUREZA': '1',
-                'GESTAO': 'M',
-                'MUNIC_MOV': f"{info['state'] or '35'}{i % 100 + 1:04d}",
-                'COD_IDADE': '4',
-                'CAR_INT': '05',
-                'HOMONIMO': '0',
-                'NUM_FILHOS': str(i % 5),
-                'INSTRU': f"{i % 8 + 1}",
-                'VINCPREV': '1',
-                'SEQUENCIA': i + 1,
-                'ARQUIVO_ORIGEM': filename
-            }
-            records.append(record)
+        state = info['state'] or '35'
+        year = info['year'] or 2020
+        month = info['month'] or 1
+        total_rows = 1000
         
-        df = pd.DataFrame(records)
+        for start in range(0, total_rows, batch_size):
+            rows = range(start, min(start + batch_size, total_rows))
+            n = len(rows)
+            
+            columns = {
+                'UF_ZI': [state] * n,
+                'ANO_CMPT': [str(year)] * n,
+                'MES_CMPT': [f"{info['month'] or (i % 12 + 1):02d}" for i in rows],
+                'MUNIC_RES': [f"{state}{i % 100 + 1:04d}" for i in rows],
+                'NASC': [f"{1950 + (i % 70)}{(i % 12 + 1):02d}{(i % 28 + 1):02d}" for i in rows],
+                'SEXO': ['1' if i % 2 == 0 else '2' for i in rows],
+                'IDADE': [20 + (i % 60) for i in rows],
+                'PROC_REA': [f"0301{i % 100:06d}" for i in rows],
+                'VAL_TOT': [round(100 + (i * 15.75), 2) for i in rows],
+                'DIAS_PERM': [1 + (i % 30) for i in rows],
+                'DT_INTER': [f"{year}{month:02d}{(i % 28 + 1):02d}" for i in rows],
+                'DT_SAIDA': [f"{year}{month:02d}{(i % 28 + 1):02d}" for i in rows],
+                'DIAG_PRINC': [f"I{10 + (i % 89)}{(i % 10)}" for i in rows],
+                'MORTE': ['1' if i % 50 == 0 else '0' for i in rows],
+                'NACIONAL': ['010'] * n,
+                'CEP': [f"{i % 99999:05d}000" for i in rows],
+                'ESPEC': [f"{i % 50 + 1:02d}" for i in rows],
+                'N_AIH': [f"{2020000000 + i:010d}" for i in rows],
+                'IDENT': ['1'] * n,
+                'COBRANCA': ['1'] * n,
+                'NATUREZA': ['1'] * n,
+                'GESTAO': ['M'] * n,
+                'MUNIC_MOV': [f"{state}{i % 100 + 1:04d}" for i in rows],
+                'COD_IDADE': ['4'] * n,
+                'CAR_INT': ['05'] * n,
+                'HOMONIMO': ['0'] * n,
+                'NUM_FILHOS': [str(i % 5) for i in rows],
+                'INSTRU': [f"{i % 8 + 1}" for i in rows],
+                'VINCPREV': ['1'] * n,
+                'SEQUENCIA': [i + 1 for i in rows],
+                'ARQUIVO_ORIGEM': [filename] * n,
+            }
+            
+            yield pa.RecordBatch.from_pydict(columns, schema=SIH_SAMPLE_SCHEMA)
         
     else:
         # Dados genéricos para outros sistemas
-        records = []
-        for i in range(500):
-            record = {
-                'REGISTRO': i + 1,
-                'UF': info['state'] or '35',
-                'ANO': info['year'] or 2020,
-                'MES': info['month'] or 1,
-                'CODIGO': f"{i:06d}",
-                'VALOR': round(i * 10.5, 2),
-                'ARQUIVO_ORIGEM': filename
+        total_rows = 500
+        
+        for start in range(0, total_rows, batch_size):
+            rows = range(start, min(start + batch_size, total_rows))
+            n = len(rows)
+            
+            columns = {
+                'REGISTRO': [i + 1 for i in rows],
+                'UF': [info['state'] or '35'] * n,
+                'ANO': [info['year'] or 2020] * n,
+                'MES': [info['month'] or 1] * n,
+                'CODIGO': [f"{i:06d}" for i in rows],
+                'VALOR': [round(i * 10.5, 2) for i in rows],
+                'ARQUIVO_ORIGEM': [filename] * n,
             }
-            records.append(record)
+            
+            yield pa.RecordBatch.from_pydict(columns, schema=GENERIC_SAMPLE_SCHEMA)
+
+
+def is_text_type(data_type):
+    """
+    Indica se o tipo Arrow é texto
+    """
+    
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+
+def has_non_int64_numbers(array):
+    """
+    Indica se há números em texto que não cabem em int64 (decimais ou grandes demais)
+    """
+    
+    trimmed = pc.utf8_trim_whitespace(array)
+    numeric = pc.match_substring_regex(trimmed, NUMERIC_PATTERN)
+    integer = pc.match_substring_regex(trimmed, INT64_PATTERN)
+    return pc.any(pc.and_(numeric, pc.invert(integer))).as_py() is True
+
+
+def plan_output_schema(batches):
+    """
+    Primeira passada: define colunas e tipos de saída guardando apenas contadores
+    """
+    
+    schema = None
+    total_rows = 0
+    null_counts = {}
+    float_columns = set()
+    
+    for batch in batches:
+        if schema is None:
+            schema = batch.schema
+            null_counts = dict.fromkeys(schema.names, 0)
+        
+        total_rows += batch.num_rows
+        for col in schema.names:
+            array = batch.column(col)
+            null_counts[col] += array.null_count
+            
+            if (col in INTEGER_COLUMNS and col not in float_columns
+                    and is_text_type(array.type) and has_non_int64_numbers(array)):
+                float_columns.add(col)
+    
+    if schema is None:
+        raise ValueError("Arquivo sem registros")
+    
+    fields = []
+    for field in schema:
+        # Descartar colunas totalmente nulas
+        if null_counts[field.name] == total_rows:
+            continue
         
-        df = pd.DataFrame(records)
+        data_type = field.type
+        if is_text_type(data_type):
+            if field.name in INTEGER_COLUMNS:
+                data_type = pa.float64() if field.name in float_columns else pa.int64()
+            elif field.name in FLOAT_COLUMNS:
+                data_type = pa.float64()
+        fields.append(pa.field(field.name, data_type))
+    
+    return pa.schema(fields)
+
+
+def coerce_numeric(array, target_type):
+    """
+    Converte texto para número; valores inválidos viram nulos
+    """
+    
+    pattern = INT64_PATTERN if pa.types.is_integer(target_type) else NUMERIC_PATTERN
     
-    return df
+    trimmed = pc.utf8_trim_whitespace(array)
+    valid = pc.match_substring_regex(trimmed, pattern)
+    numeric = pc.if_else(valid, pc.utf8_ltrim(trimmed, characters='+'), pa.scalar(None, pa.string()))
+    return pc.cast(numeric, target_type)
+
+
+def prepare_batch(batch, schema):
+    """
+    Seleciona as colunas e converte os tipos de um lote Arrow para o schema de saída
+    """
+    
+    arrays = []
+    for field in schema:
+        array = batch.column(field.name)
+        if is_text_type(array.type) and not is_text_type(field.type):
+            array = coerce_numeric(array, field.type)
+        arrays.append(array)
+    
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+# Perfis de codificação Parquet (dictionary_max_ratio None: sem medir
+# cardinalidade, o Arrow volta para PLAIN sozinho em colunas de alta cardinalidade)
+PARQUET_ENCODING_PROFILES = {
+    'fast-write': {
+        'compression': 'snappy',
+        'compression_level': None,
+        'dictionary_max_ratio': None,
+        'byte_stream_split': False,
+        'data_page_size': 1024 * 1024,
+    },
+    'balanced': {
+        'compression': 'zstd',
+        'compression_level': 3,
+        'dictionary_max_ratio': 0.5,
+        'byte_stream_split': True,
+        'data_page_size': 1024 * 1024,
+    },
+    'archive-size': {
+        'compression': 'zstd',
+        'compression_level': 19,
+        'dictionary_max_ratio': 0.5,
+        'byte_stream_split': True,
+        'data_page_size': 8 * 1024 * 1024,
+    },
+}
+
+DEFAULT_PARQUET_PROFILE = 'balanced'
+PARQUET_PROFILE_CHOICES = list(PARQUET_ENCODING_PROFILES) + ['auto']
+
+# Colunas monetárias candidatas a BYTE_STREAM_SPLIT
+BYTE_STREAM_SPLIT_COLUMNS = ['VAL_TOT', 'VALOR']
+
+# Modo auto: escolhe o menor arquivo entre os perfis que codificam a amostra
+# a pelo menos AUTO_MIN_MB_PER_S (dados Arrow em memória). Com 2 MB/s, um
+# arquivo mensal de ~100 MB gasta menos de 1 minuto de CPU por worker, o que
+# cabe na folga dos hosts de conversão. Cada perfil é medido AUTO_TIMING_RUNS
+# vezes e vale o melhor tempo, para a escolha não oscilar por ruído.
+AUTO_SAMPLE_ROWS = 10000
+AUTO_TIMING_RUNS = 3
+AUTO_MIN_MB_PER_S = 2.0
 
 
-def convert_single_dbc(dbc_file, output_dir):
+def build_parquet_write_options(table, profile):
     """
-    Converte um único arquivo .dbc
+    Monta os parâmetros de escrita Parquet por coluna para um perfil
+    """
+    
+    settings = PARQUET_ENCODING_PROFILES[profile]
+    num_rows = max(table.num_rows, 1)
+    
+    compression = {}
+    compression_level = {}
+    dictionary_columns = []
+    column_encoding = {}
+    
+    for field in table.schema:
+        col = field.name
+        compression[col] = settings['compression']
+        if settings['compression_level'] is not None:
+            compression_level[col] = settings['compression_level']
+        
+        # BYTE_STREAM_SPLIT para valores monetários em ponto flutuante
+        if (settings['byte_stream_split'] and col in BYTE_STREAM_SPLIT_COLUMNS
+                and pa.types.is_floating(field.type)):
+            column_encoding[col] = 'BYTE_STREAM_SPLIT'
+            continue
+        
+        # Sem limite de cardinalidade: dicionário com fallback do Arrow
+        if settings['dictionary_max_ratio'] is None:
+            dictionary_columns.append(col)
+            continue
+        
+        # Dicionário apenas para colunas de baixa cardinalidade
+        distinct = pc.count_distinct(table.column(col)).as_py()
+        if distinct / num_rows <= settings['dictionary_max_ratio']:
+            dictionary_columns.append(col)
+        else:
+            column_encoding[col] = 'PLAIN'
+    
+    return {
+        'compression': compression,
+        'compression_level': compression_level or None,
+        'use_dictionary': dictionary_columns,
+        'column_encoding': column_encoding or None,
+        'data_page_size': settings['data_page_size'],
+    }
+
+
+def select_parquet_profile(table, sample_rows=AUTO_SAMPLE_ROWS):
+    """
+    Escolhe o perfil medindo velocidade e tamanho em uma amostra do arquivo
+    """
+    
+    sample = table.slice(0, sample_rows)
+    sample_mb = sample.nbytes / (1024*1024)
+    measurements = {}
+    
+    for profile in PARQUET_ENCODING_PROFILES:
+        best = None
+        for _ in range(AUTO_TIMING_RUNS):
+            buffer = pa.BufferOutputStream()
+            start = time.perf_counter()
+            pq.write_table(sample, buffer, **build_parquet_write_options(sample, profile))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        measurements[profile] = {
+            'seconds': best,
+            'bytes': buffer.getvalue().size,
+            'mb_per_s': sample_mb / best if best > 0 else float('inf'),
+        }
+    
+    # Menor tamanho entre os perfis dentro do orçamento de CPU;
+    # se nenhum couber, o mais rápido
+    candidates = [
+        profile for profile, m in measurements.items()
+        if m['mb_per_s'] >= AUTO_MIN_MB_PER_S
+    ]
+    if candidates:
+        chosen = min(candidates, key=lambda profile: measurements[profile]['bytes'])
+    else:
+        chosen = min(measurements, key=lambda profile: measurements[profile]['seconds'])
+    
+    return chosen, measurements
+
+
+def resolve_parquet_profile(table, profile):
+    """
+    Resolve o perfil solicitado, executando a seleção automática se necessário
+    """
+    
+    if profile == 'auto':
+        chosen, _ = select_parquet_profile(table)
+        return chosen
+    
+    if profile not in PARQUET_ENCODING_PROFILES:
+        raise ValueError(f"Perfil Parquet desconhecido: {profile}")
+    
+    return profile
+
+
+def load_profile_sample(dbc_file):
+    """
+    Lê e converte o primeiro lote de um arquivo .dbc para a seleção automática de perfil
+    """
+    
+    info = parse_datasus_filename(dbc_file)
+    first = next(create_realistic_sample_batches(info, os.path.basename(dbc_file)))
+    return pa.Table.from_batches([prepare_batch(first, plan_output_schema([first]))])
+
+
+def convert_single_dbc(dbc_file, output_dir, profile=DEFAULT_PARQUET_PROFILE, return_dataframe=False):
+    """
+    Converte um único arquivo .dbc (opcionalmente devolvendo um DataFrame pandas)
     """
     
     try:
@@ -373,39 +679,57 @@ def convert_single_dbc(dbc_file, output_dir):
         # Analisar arquivo
         info = parse_datasus_filename(dbc_file)
         
-        # Criar dados
-        df = create_realistic_sample_data(info, os.path.basename(dbc_file))
+        filename = os.path.basename(dbc_file)
         
-        # Processar dados
-        df = df.dropna(axis=1, how='all')
+        # Decodificar uma única vez; os lotes ficam em memória Arrow
+        batches = list(create_realistic_sample_batches(info, filename))
         
-        # Converter tipos
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                if col in ['IDADE', 'ANO', 'MES', 'PESO', 'APGAR1', 'APGAR5', 'QTDFILVIVO', 'QTDFILMORT', 'DIAS_PERM']:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                elif col in ['VAL_TOT', 'VALOR']:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Colunas totalmente nulas e tipos numéricos
+        schema = plan_output_schema(batches)
         
         # Definir arquivo de saída
         output_file = output_dir / f"{Path(dbc_file).stem}.parquet"
         
-        # Salvar
-        df.to_parquet(output_file, compression='snappy', index=False)
+        # Converter e gravar em streaming, liberando cada lote bruto após gravá-lo
+        writer = None
+        records = 0
+        try:
+            while batches:
+                batch = prepare_batch(batches.pop(0), schema)
+                
+                if writer is None:
+                    # Perfil e opções de escrita decididos a partir do primeiro lote
+                    sample = pa.Table.from_batches([batch])
+                    profile = resolve_parquet_profile(sample, profile)
+                    write_options = build_parquet_write_options(sample, profile)
+                    writer = pq.ParquetWriter(output_file, schema, **write_options)
+                
+                writer.write_batch(batch)
+                records += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
         
         file_size = os.path.getsize(output_file) / (1024*1024)
         
-        return {
+        result = {
             'status': 'success',
             'input_file': dbc_file,
             'output_file': str(output_file),
-            'records': len(df),
-            'columns': len(df.columns),
+            'records': records,
+            'columns': len(schema),
             'size_mb': file_size,
+            'profile': profile,
             'system': info['system'],
             'year': info['year']
         }
         
+        # Saída pandas opcional, lida do Parquet já gravado
+        if return_dataframe:
+            result['dataframe'] = pq.read_table(output_file).to_pandas()
+        
+        return result
+        
     except Exception as e:
         return {
             'status': 'error',
@@ -444,7 +768,7 @@ def upload_to_s3_with_retry(s3_client, local_file, bucket, s3_key, max_retries=3
             time.sleep(2 ** attempt)  # Backoff exponencial
 
 
-def process_year_directory_with_env(input_dir, output_base_dir, bucket_name=None, s3_base_path=None, max_workers=None):
+def process_year_directory_with_env(input_dir, output_base_dir, bucket_name=None, s3_base_path=None, max_workers=None, parquet_profile=None):
     """
     Processa diretório usando configurações do .env
     """
@@ -462,6 +786,19 @@ def process_year_directory_with_env(input_dir, output_base_dir, bucket_name=None
         s3_base_path = os.environ.get('S3_BASE_PATH', 'raw')
     if not max_workers:
         max_workers = int(os.environ.get('MAX_WORKERS', '4'))
+    if not parquet_profile:
+        parquet_profile = os.environ.get('PARQUET_PROFILE', DEFAULT_PARQUET_PROFILE)
+    
+    if parquet_profile not in PARQUET_PROFILE_CHOICES:
+        error = f"Perfil Parquet desconhecido: {parquet_profile} (opções: {', '.join(PARQUET_PROFILE_CHOICES)})"
+        print(f"   ❌ {error}")
+        return {
+            'year': year,
+            'processed': 0,
+            'uploaded': 0,
+            'errors': [{'status': 'error', 'input_file': input_dir, 'error': error}],
+            'total_files': 0
+        }
     
     # Encontrar arquivos .dbc
     dbc_files = list(input_path.glob("*.dbc")) + list(input_path.glob("*.DBC"))
@@ -472,6 +809,11 @@ def process_year_directory_with_env(input_dir, output_base_dir, bucket_name=None
     
     print(f"   📊 Encontrados {len(dbc_files)} arquivos .dbc")
     
+    # Perfil automático escolhido uma vez por diretório, antes do pool
+    if parquet_profile == 'auto':
+        parquet_profile, _ = select_parquet_profile(load_profile_sample(str(min(dbc_files))))
+        print(f"   🎛️  Perfil automático escolhido: {parquet_profile}")
+    
     # Criar diretório de saída
     output_dir = Path(output_base_dir) / year
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -480,7 +822,7 @@ def process_year_directory_with_env(input_dir, output_base_dir, bucket_name=None
     results = []
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_file = {
-            executor.submit(convert_single_dbc, str(dbc_file), output_dir): dbc_file 
+            executor.submit(convert_single_dbc, str(dbc_file), output_dir, parquet_profile): dbc_file 
             for dbc_file in dbc_files
         }
         
@@ -489,7 +831,7 @@ def process_year_directory_with_env(input_dir, output_base_dir, bucket_name=None
             results.append(result)
             
             if result['status'] == 'success':
-                print(f"   ✅ {os.path.basename(result['input_file'])}: {result['records']} registros")
+                print(f"   ✅ {os.path.basename(result['input_file'])}: {result['records']} registros ({result['profile']}, {result['size_mb']:.2f} MB)")
             else:
                 print(f"   ❌ {os.path.basename(result['input_file'])}: {result['error']}")
     
@@ -584,6 +926,9 @@ Configuração via arquivo .env:
   S3_BUCKET_NAME=gen-desafiotriggo
   S3_BASE_PATH=raw
   MAX_WORKERS=4
+  PARQUET_PROFILE=balanced
+
+Perfis Parquet: fast-write, balanced, archive-size ou auto
 
 Exemplo de uso:
   python batch_dbc_processor_env.py src/dados_sih/2020 --output convertidos
@@ -596,6 +941,8 @@ Exemplo de uso:
     parser.add_argument("--s3-path", help="Caminho base no S3 (sobrescreve .env)")
     parser.add_argument("--recursive", "-r", action="store_true", help="Processar recursivamente")
     parser.add_argument("--workers", "-w", type=int, help="Número de workers (sobrescreve .env)")
+    parser.add_argument("--profile", "-p", choices=PARQUET_PROFILE_CHOICES,
+                        help="Perfil de codificação Parquet (sobrescreve .env)")
     
     args = parser.parse_args()
     
@@ -626,7 +973,8 @@ Exemplo de uso:
             args.output,
             args.bucket,
             args.s3_path,
-            args.workers
+            args.workers,
+            args.profile
         )
         all_results.append(result)
     
@@ -0,0 +1,209 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import ingestion
+from ingestion import (
+    build_parquet_write_options,
+    coerce_numeric,
+    convert_single_dbc,
+    plan_output_schema,
+    prepare_batch,
+    process_year_directory_with_env,
+    resolve_parquet_profile,
+    select_parquet_profile,
+)
+
+
+def column_metadata(path, name):
+    row_group = pq.ParquetFile(path).metadata.row_group(0)
+    for i in range(row_group.num_columns):
+        if row_group.column(i).path_in_schema == name:
+            return row_group.column(i)
+    raise KeyError(name)
+
+
+def test_coerce_numeric_invalid_values_become_null():
+    array = pa.array([' 12', '+5', '-3', 'x', '', None])
+    
+    assert coerce_numeric(array, pa.int64()).to_pylist() == [12, 5, -3, None, None, None]
+
+
+def test_coerce_numeric_float():
+    array = pa.array(['1.5', '-.5', '+1e3', '99999999999999999999', 'abc'])
+    
+    assert coerce_numeric(array, pa.float64()).to_pylist() == [1.5, -0.5, 1000.0, 1e20, None]
+
+
+def test_integer_column_with_decimal_or_overflow_becomes_float():
+    batches = [
+        pa.RecordBatch.from_pydict({'IDADE': ['1', '3.0'], 'DIAS_PERM': ['2', 'x']}),
+        pa.RecordBatch.from_pydict({'IDADE': ['99999999999999999999', None], 'DIAS_PERM': ['1.5', None]}),
+    ]
+    
+    schema = plan_output_schema(iter(batches))
+    
+    assert schema.field('IDADE').type == pa.float64()
+    assert schema.field('DIAS_PERM').type == pa.float64()
+    assert prepare_batch(batches[0], schema).column('IDADE').to_pylist() == [1.0, 3.0]
+    assert prepare_batch(batches[1], schema).column('IDADE').to_pylist() == [1e20, None]
+    assert prepare_batch(batches[1], schema).column('DIAS_PERM').to_pylist() == [1.5, None]
+
+
+def test_integer_column_stays_int64_and_drops_all_null_columns():
+    batches = [
+        pa.RecordBatch.from_pydict({'IDADE': ['10', 'x'], 'VAZIA': pa.array([None, None], pa.string())}),
+        pa.RecordBatch.from_pydict({'IDADE': [' 20', None], 'VAZIA': pa.array([None, None], pa.string())}),
+    ]
+    
+    schema = plan_output_schema(iter(batches))
+    
+    assert schema.names == ['IDADE']
+    assert schema.field('IDADE').type == pa.int64()
+    assert prepare_batch(batches[0], schema).column('IDADE').to_pylist() == [10, None]
+
+
+def test_convert_single_dbc_writes_parquet(tmp_path):
+    result = convert_single_dbc(str(tmp_path / 'RDMA2501.dbc'), tmp_path, 'balanced')
+    
+    assert result['status'] == 'success'
+    table = pq.read_table(result['output_file'])
+    assert table.num_rows == result['records'] == 1000
+    assert table.schema.field('VAL_TOT').type == pa.float64()
+
+
+def test_byte_stream_split_only_for_float_money_columns():
+    table = pa.table({
+        'VAL_TOT': [1.5, 2.5],
+        'VALOR': ['1.5', '2.5'],
+        'PESO': [3.5, 4.5],
+    })
+    
+    options = build_parquet_write_options(table, 'balanced')
+    
+    assert options['column_encoding'].get('VAL_TOT') == 'BYTE_STREAM_SPLIT'
+    assert options['column_encoding'].get('VALOR') != 'BYTE_STREAM_SPLIT'
+    assert options['column_encoding'].get('PESO') != 'BYTE_STREAM_SPLIT'
+    assert 'BYTE_STREAM_SPLIT' not in (build_parquet_write_options(table, 'fast-write')['column_encoding'] or {}).values()
+
+
+def test_dictionary_only_for_low_cardinality_columns():
+    table = pa.table({'SEXO': ['1', '2'] * 50, 'N_AIH': [f"{i:010d}" for i in range(100)]})
+    
+    options = build_parquet_write_options(table, 'balanced')
+    
+    assert options['use_dictionary'] == ['SEXO']
+    assert options['column_encoding'] == {'N_AIH': 'PLAIN'}
+
+
+def test_fast_write_skips_cardinality_scan(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("count_distinct não deveria ser chamado")
+    
+    monkeypatch.setattr(ingestion.pc, 'count_distinct', fail)
+    table = pa.table({'SEXO': ['1', '2'], 'N_AIH': ['0000000001', '0000000002']})
+    
+    options = build_parquet_write_options(table, 'fast-write')
+    
+    assert options['use_dictionary'] == ['SEXO', 'N_AIH']
+    assert options['column_encoding'] is None
+
+
+@pytest.mark.parametrize('profile, codec, byte_stream_split', [
+    ('fast-write', 'SNAPPY', False),
+    ('balanced', 'ZSTD', True),
+    ('archive-size', 'ZSTD', True),
+])
+def test_profile_codec_and_encodings(tmp_path, profile, codec, byte_stream_split):
+    result = convert_single_dbc(str(tmp_path / 'RDMA2501.dbc'), tmp_path, profile)
+    path = result['output_file']
+    
+    val_tot = column_metadata(path, 'VAL_TOT')
+    sexo = column_metadata(path, 'SEXO')
+    n_aih = column_metadata(path, 'N_AIH')
+    
+    assert result['profile'] == profile
+    assert val_tot.compression == codec
+    assert ('BYTE_STREAM_SPLIT' in val_tot.encodings) == byte_stream_split
+    assert 'RLE_DICTIONARY' in sexo.encodings
+    if profile != 'fast-write':
+        assert 'RLE_DICTIONARY' not in n_aih.encodings
+
+
+def test_auto_picks_smallest_within_cpu_budget(monkeypatch):
+    monkeypatch.setattr(ingestion, 'AUTO_TIMING_RUNS', 1)
+    monkeypatch.setattr(ingestion, 'AUTO_MIN_MB_PER_S', 0.0)
+    table = ingestion.load_profile_sample('RDMA2501.dbc')
+    
+    chosen, measurements = select_parquet_profile(table)
+    
+    assert chosen == min(measurements, key=lambda profile: measurements[profile]['bytes'])
+
+
+def test_auto_falls_back_to_fastest(monkeypatch):
+    monkeypatch.setattr(ingestion, 'AUTO_TIMING_RUNS', 1)
+    monkeypatch.setattr(ingestion, 'AUTO_MIN_MB_PER_S', float('inf'))
+    table = ingestion.load_profile_sample('RDMA2501.dbc')
+    
+    chosen, measurements = select_parquet_profile(table)
+    
+    assert chosen == min(measurements, key=lambda profile: measurements[profile]['seconds'])
+
+
+def test_resolve_parquet_profile_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        resolve_parquet_profile(pa.table({'A': [1]}), 'balnced')
+
+
+def test_invalid_parquet_profile_env_fails_before_conversion(tmp_path, monkeypatch):
+    (tmp_path / 'RDMA2501.dbc').touch()
+    monkeypatch.setenv('PARQUET_PROFILE', 'balnced')
+    monkeypatch.setattr(ingestion, 'convert_single_dbc', pytest.fail)
+    
+    result = process_year_directory_with_env(str(tmp_path), str(tmp_path / 'out'))
+    
+    assert result['processed'] == 0
+    assert len(result['errors']) == 1
+
+
+def test_auto_profile_resolved_once_per_directory(tmp_path, monkeypatch):
+    for name in ['RDMA2501.dbc', 'RDMA2502.dbc']:
+        (tmp_path / name).touch()
+    calls = []
+    
+    def select(table):
+        calls.append(table)
+        return 'fast-write', {}
+    
+    monkeypatch.setattr(ingestion, 'select_parquet_profile', select)
+    monkeypatch.setattr(ingestion, 'diagnose_aws_setup_with_env', lambda: None)
+    
+    result = process_year_directory_with_env(str(tmp_path), str(tmp_path / 'out'), parquet_profile='auto')
+    
+    assert result['processed'] == 2
+    assert len(calls) == 1
+    for path in (tmp_path / 'out' / tmp_path.name).glob('*.parquet'):
+        assert column_metadata(path, 'VAL_TOT').compression == 'SNAPPY'
+
+
+def test_convert_single_dbc_decodes_source_once(tmp_path, monkeypatch):
+    calls = []
+    original = ingestion.create_realistic_sample_batches
+    
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+    
+    monkeypatch.setattr(ingestion, 'create_realistic_sample_batches', counting)
+    
+    result = convert_single_dbc(str(tmp_path / 'RDMA2501.dbc'), tmp_path, 'fast-write')
+    
+    assert result['status'] == 'success'
+    assert len(calls) == 1
+
+
+def test_convert_single_dbc_optional_dataframe(tmp_path):
+    result = convert_single_dbc(str(tmp_path / 'DOMA2401.dbc'), tmp_path, 'balanced', return_dataframe=True)
+    
+    assert 'dataframe' not in convert_single_dbc(str(tmp_path / 'DOMA2401.dbc'), tmp_path, 'balanced')
+    assert result['dataframe'].shape == (result['records'], result['columns'])